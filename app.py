@@ -3089,7 +3089,7 @@ def create_home_layout(user_data=None):
         create_stats_overview(),
 
         # News feed section
-        create_news_feed_section(posts, user_data) if posts else html.Div(),
+        create_news_feed_section(posts, user_data),
 
         create_about_ir_section(),
         create_feature_showcase(),
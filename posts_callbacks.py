@@ -3,20 +3,24 @@ Posts System Callbacks - COMPLETE REBUILD
 Clean, working callbacks that match the new UI
 """
 
-from dash import Input, Output, State, callback, ALL, ctx, no_update, html
+from dash import Input, Output, State, callback, ALL, MATCH, ctx, no_update, html, Patch
 import dash_bootstrap_components as dbc
 from datetime import datetime, timedelta
 import dash as dash
 from posts_system import (
-    create_post, get_active_posts, get_post_by_id,
+    create_post, get_active_posts, get_post_by_id, is_post_expired,
     update_post, delete_post, cleanup_expired_posts
 )
+from posts_ui import (
+    NEWS_PAGE_SIZE, ADMIN_POSTS_PAGE_SIZE, USC_COLORS, _CATEGORY_COLORS, _EMPTY_DIV,
+    _STYLE_SECTION_BG, _category_label, create_full_post_card, create_post_list_item
+)
 
-USC_COLORS = {
-    'primary_green': '#1B5E20',
-    'accent_yellow': '#FDD835',
-    'light_gray': '#F8F9FA'
-}
+# Style dicts used only by these callbacks - built once instead of per invocation
+_STYLE_PREVIEW_TITLE = {'color': USC_COLORS['primary_green']}
+_STYLE_PRE_WRAP = {'whiteSpace': 'pre-wrap'}
+_STYLE_SHOW = {'display': 'block'}
+_STYLE_HIDE = {'display': 'none'}
 
 
 # ============================================================================
@@ -62,8 +66,8 @@ def toggle_post_form(n_clicks, is_open):
 def toggle_custom_date(duration):
     """Show/hide custom date picker"""
     if duration == 'custom':
-        return {'display': 'block'}
-    return {'display': 'none'}
+        return _STYLE_SHOW
+    return _STYLE_HIDE
 
 
 # ============================================================================
@@ -208,37 +212,31 @@ def preview_post(n_clicks, title, content, category, options):
     """Show preview of post"""
 
     if not n_clicks or not title or not content:
-        return html.Div()
-
-    category_colors = {
-        'announcement': 'primary',
-        'news': 'info',
-        'event': 'success',
-        'policy': 'warning',
-        'data_release': 'secondary'
-    }
-
-    is_pinned = 'pinned' in (options or [])
+        return _EMPTY_DIV
+
+    badges = [
+        dbc.Badge("PREVIEW", color="warning", className="mb-2"),
+        dbc.Badge(
+            _category_label(category or 'announcement'),
+            color=_CATEGORY_COLORS.get(category, 'primary'),
+            className="ms-2 mb-2"
+        )
+    ]
+    if 'pinned' in (options or []):
+        badges.append(dbc.Badge("Pinned", color="warning", className="ms-2 mb-2"))
 
     return dbc.Card([
-        dbc.CardBody([
-            dbc.Badge("PREVIEW", color="warning", className="mb-2"),
-            dbc.Badge(
-                (category or 'announcement').replace('_', ' ').title(),
-                color=category_colors.get(category, 'primary'),
-                className="ms-2 mb-2"
-            ),
-            dbc.Badge("Pinned", color="warning", className="ms-2 mb-2") if is_pinned else html.Span(),
+        dbc.CardBody(badges + [
             html.H4(title, className="fw-bold mt-3 mb-3",
-                   style={'color': USC_COLORS['primary_green']}),
-            html.P(content, style={'whiteSpace': 'pre-wrap'}),
+                   style=_STYLE_PREVIEW_TITLE),
+            html.P(content, style=_STYLE_PRE_WRAP),
             html.Hr(),
             html.Small([
                 html.I(className="fas fa-user me-2"),
                 "You • Just now"
             ], className="text-muted")
         ])
-    ], className="mt-3", style={'backgroundColor': USC_COLORS['light_gray']})
+    ], className="mt-3", style=_STYLE_SECTION_BG)
 
 
 # ============================================================================
@@ -358,6 +356,101 @@ def auto_cleanup(n_intervals):
         return {'error': str(e)}
 
 
+# ============================================================================
+# CALLBACK 9: NEWS PAGE - LOAD MORE POSTS
+# ============================================================================
+
+@callback(
+    Output('news-regular-posts', 'children'),
+    Output('news-shown-post-ids', 'data'),
+    Output('news-load-more-btn', 'style'),
+    Input('news-load-more-btn', 'n_clicks'),
+    State('news-shown-post-ids', 'data'),
+    State('user-session', 'data'),
+    prevent_initial_call=True
+)
+def load_more_news_posts(n_clicks, shown_ids, user_session):
+    """Append the next page of regular posts (only the new cards are sent)"""
+
+    if not n_clicks:
+        return no_update, no_update, no_update
+
+    # Page by the ids already shown rather than an offset, so posts published or
+    # archived since the page loaded cannot shift a rendered card into the next page
+    shown = set(shown_ids or ())
+    user_tier = user_session.get('access_tier', 1) if user_session else 1
+    remaining = [p for p in get_active_posts(user_tier=user_tier)
+                 if not p['is_pinned'] and p['id'] not in shown]
+
+    page = remaining[:NEWS_PAGE_SIZE]
+    children = Patch()
+    for post in page:
+        children.append(create_full_post_card(post))
+
+    button_style = _STYLE_HIDE if len(remaining) <= NEWS_PAGE_SIZE else no_update
+    return children, (shown_ids or []) + [p['id'] for p in page], button_style
+
+
+# ============================================================================
+# CALLBACK 10: POSTS MANAGEMENT - LOAD MORE POSTS
+# ============================================================================
+
+@callback(
+    Output('admin-posts-list', 'children'),
+    Output('admin-posts-shown-ids', 'data'),
+    Output('admin-posts-load-more-btn', 'style'),
+    Input('admin-posts-load-more-btn', 'n_clicks'),
+    State('admin-posts-shown-ids', 'data'),
+    State('user-session', 'data'),
+    prevent_initial_call=True
+)
+def load_more_admin_posts(n_clicks, shown_ids, user_session):
+    """Append the next page of rows to the posts management list"""
+
+    if not n_clicks or not user_session or user_session.get('access_tier', 0) < 4:
+        return no_update, no_update, no_update
+
+    # Page by the ids already listed, so rows never repeat when posts change meanwhile
+    shown = set(shown_ids or ())
+    remaining = [p for p in get_active_posts(user_tier=4, include_expired=True)
+                 if p['id'] not in shown]
+
+    page = remaining[:ADMIN_POSTS_PAGE_SIZE]
+    children = Patch()
+    for post in page:
+        children.append(create_post_list_item(post))
+
+    button_style = _STYLE_HIDE if len(remaining) <= ADMIN_POSTS_PAGE_SIZE else no_update
+    return children, (shown_ids or []) + [p['id'] for p in page], button_style
+
+
+# ============================================================================
+# CALLBACK 11: NEWS PAGE - EXPAND LONG POST CONTENT
+# ============================================================================
+
+@callback(
+    Output({'type': 'post-content', 'post_id': MATCH}, 'children'),
+    Output({'type': 'expand-post', 'post_id': MATCH}, 'style'),
+    Input({'type': 'expand-post', 'post_id': MATCH}, 'n_clicks'),
+    State('user-session', 'data'),
+    prevent_initial_call=True
+)
+def expand_post_content(n_clicks, user_session):
+    """Replace a cut post preview with its full content"""
+
+    if not n_clicks:
+        return no_update, no_update
+
+    post = get_post_by_id(ctx.triggered_id['post_id'])
+    user_tier = user_session.get('access_tier', 1) if user_session else 1
+    # Only posts the news page itself would show: published, visible to this tier, not expired
+    if (not post or post['status'] != 'published' or post['min_access_tier'] > user_tier
+            or is_post_expired(post)):
+        return no_update, no_update
+
+    return post['content'], _STYLE_HIDE
+
+
 def register_callbacks(dash_app):
     """Explicitly register all callbacks with the app"""
     # All your @callback decorators automatically register
@@ -7,6 +7,29 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 
+# Fallbacks for optional post fields, applied to every post dict returned by this
+# module so UI code can index them directly (post['is_pinned']) instead of .get()
+_POST_DEFAULTS = {
+    'is_pinned': False,
+    'view_count': 0,
+    'comments_enabled': False,
+    'is_permanent': False,
+    'expires_at': None,
+    'author_name': 'Admin',
+    'category': 'announcement',
+    'min_access_tier': 1,
+    'status': 'published'
+}
+
+
+def _post_from_row(row: sqlite3.Row) -> Dict:
+    """Convert a posts row to a dict with every optional field filled in"""
+    post = dict(row)
+    for key, default in _POST_DEFAULTS.items():
+        if post.get(key) is None:
+            post[key] = default
+    return post
+
 
 # ============================================================================
 # DATABASE INITIALIZATION
@@ -142,7 +165,8 @@ def get_active_posts(user_tier: int = 1, include_expired: bool = False) -> List[
         
         if include_expired:
             query = '''
-                SELECT p.*, u.full_name as author_name, u.email as author_email
+                SELECT p.*, u.full_name as author_name, u.email as author_email,
+                       SUBSTR(p.content, 1, 120) as excerpt, LENGTH(p.content) as content_len
                 FROM posts p
                 LEFT JOIN users u ON p.author_id = u.id
                 WHERE p.status = 'published' 
@@ -152,7 +176,8 @@ def get_active_posts(user_tier: int = 1, include_expired: bool = False) -> List[
             cursor.execute(query, (user_tier,))
         else:
             query = '''
-                SELECT p.*, u.full_name as author_name, u.email as author_email
+                SELECT p.*, u.full_name as author_name, u.email as author_email,
+                       SUBSTR(p.content, 1, 120) as excerpt, LENGTH(p.content) as content_len
                 FROM posts p
                 LEFT JOIN users u ON p.author_id = u.id
                 WHERE p.status = 'published' 
@@ -162,7 +187,7 @@ def get_active_posts(user_tier: int = 1, include_expired: bool = False) -> List[
             '''
             cursor.execute(query, (user_tier, now))
         
-        posts = [dict(row) for row in cursor.fetchall()]
+        posts = [_post_from_row(row) for row in cursor.fetchall()]
         return posts
         
     except Exception as e:
@@ -172,6 +197,13 @@ def get_active_posts(user_tier: int = 1, include_expired: bool = False) -> List[
         conn.close()
 
 
+def is_post_expired(post: Dict, now: Optional[str] = None) -> bool:
+    """Same expiry rule get_active_posts applies in SQL: non-permanent and past expires_at"""
+    if post['is_permanent'] or not post['expires_at']:
+        return False
+    return post['expires_at'] <= (now or datetime.now().isoformat())
+
+
 def get_post_by_id(post_id: int, increment_views: bool = False) -> Optional[Dict]:
     """Get single post by ID, optionally increment view count"""
     conn = sqlite3.connect('usc_ir.db')
@@ -192,7 +224,7 @@ def get_post_by_id(post_id: int, increment_views: bool = False) -> Optional[Dict
         ''', (post_id,))
         
         row = cursor.fetchone()
-        return dict(row) if row else None
+        return _post_from_row(row) if row else None
         
     except Exception as e:
         print(f"❌ Error fetching post: {str(e)}")
@@ -3,10 +3,14 @@ Posts UI Components - FIXED VERSION
 Fixed news page layout to be centered instead of full-width
 """
 
+import heapq
+import threading
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, List, Dict, Mapping, Optional
 
 USC_COLORS = {
     'primary_green': '#1B5E20',
@@ -18,107 +22,256 @@ USC_COLORS = {
     'dark_gray': '#495057'
 }
 
+# Shared style dicts - built once and reused by every card/section
+_STYLE_TITLE_GREEN = {'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}
+_STYLE_CONTENT = {'whiteSpace': 'pre-wrap', 'fontFamily': 'Roboto, sans-serif', 'lineHeight': '1.6'}
+_STYLE_ROBOTO = {'fontFamily': 'Roboto, sans-serif'}
+_STYLE_EXCERPT = {'fontFamily': 'Roboto, sans-serif', 'lineHeight': '1.5'}
+_STYLE_SECTION_BG = {'backgroundColor': USC_COLORS['light_gray']}
+
+# Shared icon components - read-only, reused across every render
+_ICON_CAL = html.I(className="far fa-calendar me-2")
+_ICON_USER = html.I(className="fas fa-user-circle me-2")
+_ICON_EYE = html.I(className="fas fa-eye me-2")
+_ICON_BULL = html.I(className="fas fa-bullhorn me-3", style={'color': USC_COLORS['accent_yellow']})
+_ICON_PIN = html.I(className="fas fa-thumbtack me-2", style={'color': USC_COLORS['accent_yellow']})
+_ICON_ARROW = html.I(className="fas fa-arrow-right ms-2")
+_ICON_PLUS = html.I(className="fas fa-plus me-2")
+_ICON_TRASH = html.I(className="fas fa-trash me-2")
+_ICON_EDIT = html.I(className="fas fa-edit me-2")
+
+# Shared "render nothing" placeholder
+_EMPTY_DIV = html.Div()
+
+# Badge color and display label per post category (read-only)
+_CATEGORY_COLORS: Mapping[str, str] = MappingProxyType({
+    'announcement': 'primary',
+    'news': 'info',
+    'event': 'success',
+    'policy': 'warning',
+    'data_release': 'secondary'
+})
+_CATEGORY_LABELS: Mapping[str, str] = MappingProxyType({
+    category: category.replace('_', ' ').title() for category in _CATEGORY_COLORS
+})
+
+# Prebuilt badges shared across post cards
+_CATEGORY_BADGES: Dict[str, dbc.Badge] = {
+    category: dbc.Badge(_CATEGORY_LABELS[category], color=color)
+    for category, color in _CATEGORY_COLORS.items()
+}
+_NEWS_CARD_BADGES: Dict[str, dbc.Badge] = {
+    category: dbc.Badge(_CATEGORY_LABELS[category], color=color, className="mb-2")
+    for category, color in _CATEGORY_COLORS.items()
+}
+_PINNED_BADGE = dbc.Badge("Pinned", color="warning", className="ms-2")
+_PINNED_BADGE_INLINE = dbc.Badge("Pinned", color="warning", className="me-2")
+
+
+def _category_label(category: str) -> str:
+    """Display label for a category, e.g. 'data_release' -> 'Data Release'"""
+    label = _CATEGORY_LABELS.get(category)
+    if label is None:
+        label = category.replace('_', ' ').title()
+    return label
+
+
+def _category_badge(category: str, badges: Dict[str, dbc.Badge], **kwargs) -> dbc.Badge:
+    """Prebuilt badge for a category, or a primary badge for unknown categories"""
+    badge = badges.get(category)
+    if badge is None:
+        badge = dbc.Badge(_category_label(category), color='primary', **kwargs)
+    return badge
+
+
+@lru_cache(maxsize=4096)
+def _format_iso(timestamp: str, fmt: str) -> str:
+    """Format an ISO timestamp string, caching by (string, format)"""
+    return datetime.fromisoformat(timestamp).strftime(fmt)
+
+
+def _excerpt(text: str, n: int = 120) -> str:
+    """Truncate text to n characters, adding an ellipsis when cut"""
+    return text if len(text) <= n else text[:n] + "..."
+
+
+def _post_excerpt(post: Dict) -> str:
+    """Card excerpt, using the excerpt/content_len pre-truncated by get_active_posts when present"""
+    excerpt = post.get('excerpt')
+    if excerpt is None:
+        return _excerpt(post['content'])
+    return excerpt + "..." if post['content_len'] > 120 else excerpt
+
+
+def _post_key(post: Dict) -> tuple:
+    """Cache key for a rendered post - changes whenever the post is edited or viewed"""
+    return post['id'], post.get('updated_at') or post['created_at'], post['view_count']
+
+
+# Guards the memo dicts below; builds run outside it because they memoize nested components
+_memo_lock = threading.Lock()
+
+def _memo(cache: Dict, key: tuple, max_size: int, build: Callable):
+    """Return cache[key], building and storing it first if missing (oldest entry evicted)"""
+    with _memo_lock:
+        value = cache.get(key)
+    if value is None:
+        value = build()
+        with _memo_lock:
+            if key not in cache and len(cache) >= max_size:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = value
+    return value
+
+
+# Rendered component trees, keyed by _post_key of the posts they show
+_card_cache: Dict[tuple, dbc.Card] = {}
+_CARD_CACHE_SIZE = 1024
+_bucket_cache: Dict[tuple, html.Div] = {}
+_BUCKET_CACHE_SIZE = 16
+_page_cache: Dict[tuple, html.Div] = {}
+_PAGE_CACHE_SIZE = 8
+
+
+def _render_bucket(bucket: List[Dict]) -> html.Div:
+    """Render a list of full post cards, reusing the tree if no post changed"""
+    sig = tuple(_post_key(p) for p in bucket)
+    return _memo(_bucket_cache, sig, _BUCKET_CACHE_SIZE,
+                 lambda: html.Div([create_full_post_card(p) for p in bucket]))
+
+
 # ============================================================================
 # FIXED: NEWS PAGE WITH CENTERED LAYOUT
 # ============================================================================
 
+# Static parts of the news page - built once at import
+_EMPTY_NEWS_PAGE = dbc.Container([
+    html.H1("News & Announcements", className="text-center my-5"),
+    dbc.Alert("No posts available", color="info", className="text-center")
+])
+
+# Hero Section - Keep full width for visual impact
+_HERO_NEWS = html.Section([
+    dbc.Container([
+        html.H1("News & Announcements", className="display-4 fw-bold mb-3 text-center",
+               style=_STYLE_TITLE_GREEN),
+        html.P("Official updates from Institutional Research",
+              className="lead text-muted text-center",
+              style=_STYLE_ROBOTO)
+    ])
+], className="py-5", style=_STYLE_SECTION_BG)
+
+_PINNED_HEADER = html.H3([_ICON_PIN, "Pinned Posts"], className="mb-4", style=_STYLE_TITLE_GREEN)
+_RECENT_HEADER = html.H3("Recent Posts", className="mb-4", style=_STYLE_TITLE_GREEN)
+
+# Regular posts rendered per page; more are appended by load_more_news_posts
+NEWS_PAGE_SIZE = 20
+_LOAD_MORE_BUTTON = html.Div([
+    dbc.Button("Load more posts", id="news-load-more-btn", color="primary", outline=True,
+               style=_STYLE_ROBOTO)
+], className="text-center")
+
+
 def create_news_page(posts: List[Dict], user_data: Optional[Dict] = None) -> html.Div:
     """Full news page with all posts - FIXED: Centered layout"""
 
     if not posts:
-        return dbc.Container([
-            html.H1("News & Announcements", className="text-center my-5"),
-            dbc.Alert("No posts available", color="info", className="text-center")
-        ])
+        return _EMPTY_NEWS_PAGE
+
+    # Same visible posts (for any tier) -> same page tree
+    sig = tuple(_post_key(p) for p in posts)
+    return _memo(_page_cache, sig, _PAGE_CACHE_SIZE, lambda: _build_news_page(posts))
 
-    # Separate pinned and regular
-    pinned = [p for p in posts if p.get('is_pinned')]
-    regular = [p for p in posts if not p.get('is_pinned')]
+
+def _build_news_page(posts: List[Dict]) -> html.Div:
+    """Build the news page tree for a non-empty post list (uncached)"""
+
+    # Separate pinned and regular in one pass
+    pinned, regular = [], []
+    for p in posts:
+        (pinned if p['is_pinned'] else regular).append(p)
 
     return html.Div([
-        # Hero Section - Keep full width for visual impact
-        html.Section([
-            dbc.Container([
-                html.H1("News & Announcements", className="display-4 fw-bold mb-3 text-center",
-                       style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
-                html.P("Official updates from Institutional Research",
-                      className="lead text-muted text-center",
-                      style={'fontFamily': 'Roboto, sans-serif'})
-            ])
-        ], className="py-5", style={'backgroundColor': USC_COLORS['light_gray']}),
+        _HERO_NEWS,
 
         # FIXED: Content Container - Removed fluid=True for centered layout
         dbc.Container([
             # Pinned posts
-            html.Div([
-                html.H3([
-                    html.I(className="fas fa-thumbtack me-2",
-                          style={'color': USC_COLORS['accent_yellow']}),
-                    "Pinned Posts"
-                ], className="mb-4", style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
-                html.Div([create_full_post_card(p) for p in pinned])
-            ], className="mb-5") if pinned else html.Div(),
-
-            # Regular posts
-            html.H3("Recent Posts", className="mb-4",
-                   style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
-            html.Div([create_full_post_card(p) for p in regular])
+            html.Div([_PINNED_HEADER, _render_bucket(pinned)],
+                     className="mb-5") if pinned else _EMPTY_DIV,
+
+            # Regular posts - first page only, the rest via "Load more"
+            _RECENT_HEADER,
+            html.Div([_render_bucket(regular[:NEWS_PAGE_SIZE])], id='news-regular-posts'),
+            # Ids already on the page (pinned included), so later pages never repeat a card
+            dcc.Store(id='news-shown-post-ids',
+                      data=[p['id'] for p in pinned] + [p['id'] for p in regular[:NEWS_PAGE_SIZE]]),
+            _LOAD_MORE_BUTTON if len(regular) > NEWS_PAGE_SIZE else _EMPTY_DIV
         ], className="py-4")  # FIXED: Removed fluid=True, content now respects Bootstrap's max-width
     ])
 
 
+# Characters of post content sent with the news page before "Show more"
+CONTENT_PREVIEW_LENGTH = 800
+
+
+def _post_content(post: Dict) -> List:
+    """Content paragraph for a full card, plus a "Show more" button if it was cut"""
+    content = post['content']
+    if len(content) <= CONTENT_PREVIEW_LENGTH:
+        return [html.P(content, style=_STYLE_CONTENT, className="mb-3")]
+    return [
+        html.P(_excerpt(content, CONTENT_PREVIEW_LENGTH),
+               id={'type': 'post-content', 'post_id': post['id']},
+               style=_STYLE_CONTENT, className="mb-1"),
+        dbc.Button("Show more", id={'type': 'expand-post', 'post_id': post['id']},
+                   color="link", size="sm", className="p-0 mb-3", style=_STYLE_ROBOTO)
+    ]
+
+
 def create_full_post_card(post: Dict) -> dbc.Card:
     """Full post card for news page with improved typography"""
+    return _memo(_card_cache, ('full',) + _post_key(post), _CARD_CACHE_SIZE,
+                 lambda: _build_full_post_card(post))
+
 
-    created_at = datetime.fromisoformat(post['created_at'])
-    date_str = created_at.strftime("%B %d, %Y at %I:%M %p")
+def _build_full_post_card(post: Dict) -> dbc.Card:
+    """Build the full post card tree (uncached)"""
 
-    category_colors = {
-        'announcement': 'primary',
-        'news': 'info',
-        'event': 'success',
-        'policy': 'warning',
-        'data_release': 'secondary'
-    }
+    date_str = _format_iso(post['created_at'], "%B %d, %Y at %I:%M %p")
+
+    header_badges = [_category_badge(post['category'], _CATEGORY_BADGES)]
+    if post['is_pinned']:
+        header_badges.append(_PINNED_BADGE)
 
     return dbc.Card([
         dbc.CardBody([
             # Header
             dbc.Row([
-                dbc.Col([
-                    dbc.Badge(
-                        post.get('category', 'announcement').replace('_', ' ').title(),
-                        color=category_colors.get(post.get('category', 'announcement'), 'primary')
-                    ),
-                    dbc.Badge("Pinned", color="warning", className="ms-2") if post.get('is_pinned') else html.Span()
-                ], width="auto"),
+                dbc.Col(header_badges, width="auto"),
                 dbc.Col([
                     html.Small([
-                        html.I(className="fas fa-eye me-2"),
-                        f"{post.get('view_count', 0)} views"
-                    ], className="text-muted", style={'fontFamily': 'Roboto, sans-serif'})
+                        _ICON_EYE,
+                        f"{post['view_count']} views"
+                    ], className="text-muted", style=_STYLE_ROBOTO)
                 ], className="text-end")
             ], className="mb-3"),
 
             # Title
             html.H4(post['title'], className="fw-bold mb-3",
-                   style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
+                   style=_STYLE_TITLE_GREEN),
 
-            # Content
-            html.P(post['content'], style={
-                'whiteSpace': 'pre-wrap',
-                'fontFamily': 'Roboto, sans-serif',
-                'lineHeight': '1.6'
-            }, className="mb-3"),
+            # Content - long posts are cut and expanded on demand by expand_post_content
+            *_post_content(post),
 
             # Footer
             html.Hr(),
             html.Small([
-                html.I(className="fas fa-user-circle me-2"),
-                html.Span(post.get('author_name', 'Admin'), className="fw-bold me-3"),
-                html.I(className="far fa-calendar me-2"),
+                _ICON_USER,
+                html.Span(post['author_name'], className="fw-bold me-3"),
+                _ICON_CAL,
                 date_str
-            ], className="text-muted", style={'fontFamily': 'Roboto, sans-serif'})
+            ], className="text-muted", style=_STYLE_ROBOTO)
         ])
     ], className="mb-4 shadow-sm")
 
@@ -127,30 +280,31 @@ def create_full_post_card(post: Dict) -> dbc.Card:
 # NEWS FEED SECTION FOR HOMEPAGE (unchanged but added font)
 # ============================================================================
 
+def _feed_order(post: Dict) -> tuple:
+    """Sort key for the homepage feed - pinned first, then newest"""
+    return bool(post['is_pinned']), post['created_at']
+
+
 def create_news_feed_section(posts: List[Dict], user_data: Optional[Dict] = None) -> html.Div:
-    """News feed for homepage - shows 3 most recent posts"""
+    """News feed for homepage - shows 3 most recent posts (pinned first)"""
 
     if not posts:
-        return html.Div()
-
-    # Take 3 most recent
-    recent_posts = posts[:3]
+        return _EMPTY_DIV
 
     return html.Section([
         dbc.Container([
             # Header
             html.H2([
-                html.I(className="fas fa-bullhorn me-3",
-                      style={'color': USC_COLORS['accent_yellow']}),
+                _ICON_BULL,
                 "Latest News & Announcements"
             ], className="text-center mb-4",
-               style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
+               style=_STYLE_TITLE_GREEN),
 
             # Posts Grid
             dbc.Row([
                 dbc.Col([
                     create_news_card(post)
-                ], width=12, md=4) for post in recent_posts
+                ], width=12, md=4) for post in heapq.nlargest(3, posts, key=_feed_order)
             ], className="g-4 mb-4"),
 
             # View All Button
@@ -158,64 +312,56 @@ def create_news_feed_section(posts: List[Dict], user_data: Optional[Dict] = None
                 dbc.Col([
                     dbc.Button([
                         "View All Announcements ",
-                        html.I(className="fas fa-arrow-right ms-2")
+                        _ICON_ARROW
                     ], href="/news", color="primary", outline=True, size="lg",
-                    style={'fontFamily': 'Roboto, sans-serif'})
+                    style=_STYLE_ROBOTO)
                 ], className="text-center")
             ])
         ], fluid=True)
-    ], className="py-5", style={'backgroundColor': USC_COLORS['light_gray']})
+    ], className="py-5", style=_STYLE_SECTION_BG)
 
 
 def create_news_card(post: Dict) -> dbc.Card:
     """Individual news card for homepage with improved typography"""
+    return _memo(_card_cache, ('news',) + _post_key(post), _CARD_CACHE_SIZE,
+                 lambda: _build_news_card(post))
 
-    # Category colors
-    category_colors = {
-        'announcement': 'primary',
-        'news': 'info',
-        'event': 'success',
-        'policy': 'warning',
-        'data_release': 'secondary'
-    }
 
-    category = post.get('category', 'announcement')
-    created_at = datetime.fromisoformat(post['created_at'])
-    date_str = created_at.strftime("%B %d, %Y")
+def _build_news_card(post: Dict) -> dbc.Card:
+    """Build the homepage news card tree (uncached)"""
+
+    category = post['category']
+    date_str = _format_iso(post['created_at'], "%B %d, %Y")
 
     return dbc.Card([
         dbc.CardBody([
             # Category badge
-            dbc.Badge(
-                category.replace('_', ' ').title(),
-                color=category_colors.get(category, 'primary'),
-                className="mb-2"
-            ),
+            _category_badge(category, _NEWS_CARD_BADGES, className="mb-2"),
 
             # Title
             html.H5(post['title'], className="card-title fw-bold mb-2",
-                   style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
+                   style=_STYLE_TITLE_GREEN),
 
             # Excerpt
             html.P(
-                post['content'][:120] + "..." if len(post['content']) > 120 else post['content'],
+                _post_excerpt(post),
                 className="card-text text-muted mb-3",
-                style={'fontFamily': 'Roboto, sans-serif', 'lineHeight': '1.5'}
+                style=_STYLE_EXCERPT
             ),
 
             # Footer
             html.Div([
                 html.Small([
-                    html.I(className="far fa-calendar me-2"),
+                    _ICON_CAL,
                     date_str
-                ], className="text-muted", style={'fontFamily': 'Roboto, sans-serif'}),
+                ], className="text-muted", style=_STYLE_ROBOTO),
                 dbc.Button(
                     "Read More →",
                     id={'type': 'view-post', 'post_id': post['id']},
                     color="link",
                     size="sm",
                     className="p-0 float-end",
-                    style={'fontFamily': 'Roboto, sans-serif'}
+                    style=_STYLE_ROBOTO
                 )
             ])
         ])
@@ -225,142 +371,144 @@ def create_news_card(post: Dict) -> dbc.Card:
 # ============================================================================
 # POSTS MANAGEMENT TAB (unchanged but added font)
 # ============================================================================
+# (icon className, icon color, label) of each statistics card, in display order
+_STATS_SPEC = (
+    ("fas fa-newspaper fa-2x mb-2", USC_COLORS['accent_yellow'], "Total Posts"),
+    ("fas fa-check-circle fa-2x mb-2", USC_COLORS['secondary_green'], "Active"),
+    ("fas fa-thumbtack fa-2x mb-2", USC_COLORS['accent_yellow'], "Pinned"),
+    ("fas fa-eye fa-2x mb-2", USC_COLORS['secondary_green'], "Total Views")
+)
+
+# Access tier badge labels (tiers are 1-4)
+_TIER_LABELS: Mapping[int, str] = MappingProxyType({tier: f"Tier {tier}" for tier in range(1, 5)})
+
+# Create-post form dropdown/checklist options
+_TIER_OPTIONS = [
+    {'label': 'Tier 1 - Public', 'value': 1},
+    {'label': 'Tier 2 - Limited', 'value': 2},
+    {'label': 'Tier 3 - Complete', 'value': 3},
+    {'label': 'Tier 4 - Admin', 'value': 4}
+]
+_CATEGORY_OPTIONS = [
+    {'label': 'Announcement', 'value': 'announcement'},
+    {'label': 'News', 'value': 'news'},
+    {'label': 'Event', 'value': 'event'}
+]
+_DURATION_OPTIONS = [
+    {'label': 'Permanent', 'value': 'permanent'},
+    {'label': '7 Days', 'value': '7'},
+    {'label': '30 Days', 'value': '30'}
+]
+_POST_OPTIONS = [
+    {'label': 'Pin to Top', 'value': 'pinned'},
+    {'label': 'Enable Comments', 'value': 'comments'}
+]
+
+# Create-post form - static (no per-request defaults), so built once at import
+_CREATE_POST_FORM = dbc.Collapse([
+    dbc.Card([
+        dbc.CardBody([
+            html.H4("Create New Post", className="mb-3",
+                    style=_STYLE_TITLE_GREEN),
+
+            dbc.Input(id="post-title-input", placeholder="Post Title", className="mb-3"),
+            dbc.Textarea(id="post-content-input", placeholder="Post Content", rows=6, className="mb-3"),
+
+            dcc.Dropdown(
+                id="post-tier-dropdown",
+                options=_TIER_OPTIONS,
+                value=1,
+                placeholder="Select Access Level",
+                className="mb-3"
+            ),
+
+            dcc.Dropdown(
+                id="post-category-dropdown",
+                options=_CATEGORY_OPTIONS,
+                value='announcement',
+                placeholder="Select Category",
+                className="mb-3"
+            ),
+
+            dcc.Dropdown(
+                id="post-duration-dropdown",
+                options=_DURATION_OPTIONS,
+                value='permanent',
+                placeholder="Select Duration",
+                className="mb-3"
+            ),
+
+            dbc.Checklist(
+                id="post-options-checklist",
+                options=_POST_OPTIONS,
+                value=[],
+                className="mb-3"
+            ),
+
+            html.Div(id="post-expiration-date", style={'display': 'none'}),
+            html.Div(id="custom-date-container", style={'display': 'none'}),
+
+            dbc.ButtonGroup([
+                dbc.Button("Publish Post", id="submit-post-btn", color="success"),
+                dbc.Button("Cancel", id="cancel-post-btn", color="secondary", outline=True)
+            ])
+        ])
+    ])
+], id="post-form-collapse", is_open=False, className="mb-4")
+
+
+@lru_cache(maxsize=64)
+def _stat_card(icon_cls: str, color: str, value: int, label: str) -> dbc.Col:
+    """Single statistics card for the posts management tab"""
+    return dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.I(className=icon_cls, style={'color': color}),
+                html.H3(value, className="mb-0", style=_STYLE_ROBOTO),
+                html.P(label, className="text-muted mb-0", style=_STYLE_ROBOTO)
+            ], className="text-center")
+        ])
+    ], width=3)
+
+
 def create_posts_management_tab(posts: List[Dict]) -> html.Div:
     """Posts management with SIMPLE delete buttons"""
 
-    # Statistics cards (your existing code)
+    # Statistics cards - single pass over posts
     total_posts = len(posts)
-    active_posts = len([p for p in posts if p.get('status') == 'published'])
-    pinned_posts = len([p for p in posts if p.get('is_pinned', False)])
-    total_views = sum([p.get('view_count', 0) for p in posts])
+    active_posts = pinned_posts = total_views = 0
+    for p in posts:
+        if p['status'] == 'published':
+            active_posts += 1
+        if p['is_pinned']:
+            pinned_posts += 1
+        total_views += p['view_count']
 
     return html.Div([
         # Page Title
         html.H2("Posts Management", className="mb-4",
-                style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
+                style=_STYLE_TITLE_GREEN),
 
-        # Statistics Row (your existing code)
+        # Statistics Row
         dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        html.I(className="fas fa-newspaper fa-2x mb-2",
-                               style={'color': USC_COLORS['accent_yellow']}),
-                        html.H3(total_posts, className="mb-0", style={'fontFamily': 'Roboto, sans-serif'}),
-                        html.P("Total Posts", className="text-muted mb-0", style={'fontFamily': 'Roboto, sans-serif'})
-                    ], className="text-center")
-                ])
-            ], width=3),
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        html.I(className="fas fa-check-circle fa-2x mb-2",
-                               style={'color': USC_COLORS['secondary_green']}),
-                        html.H3(active_posts, className="mb-0", style={'fontFamily': 'Roboto, sans-serif'}),
-                        html.P("Active", className="text-muted mb-0", style={'fontFamily': 'Roboto, sans-serif'})
-                    ], className="text-center")
-                ])
-            ], width=3),
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        html.I(className="fas fa-thumbtack fa-2x mb-2",
-                               style={'color': USC_COLORS['accent_yellow']}),
-                        html.H3(pinned_posts, className="mb-0", style={'fontFamily': 'Roboto, sans-serif'}),
-                        html.P("Pinned", className="text-muted mb-0", style={'fontFamily': 'Roboto, sans-serif'})
-                    ], className="text-center")
-                ])
-            ], width=3),
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        html.I(className="fas fa-eye fa-2x mb-2",
-                               style={'color': USC_COLORS['secondary_green']}),
-                        html.H3(total_views, className="mb-0", style={'fontFamily': 'Roboto, sans-serif'}),
-                        html.P("Total Views", className="text-muted mb-0", style={'fontFamily': 'Roboto, sans-serif'})
-                    ], className="text-center")
-                ])
-            ], width=3)
+            _stat_card(icon_cls, color, value, label)
+            for (icon_cls, color, label), value in zip(
+                _STATS_SPEC, (total_posts, active_posts, pinned_posts, total_views))
         ], className="mb-4"),
 
         # Create Post Button
         dbc.Button([
-            html.I(className="fas fa-plus me-2"),
+            _ICON_PLUS,
             "Create New Post"
         ], id="create-new-post-btn", color="primary", size="lg", className="mb-3",
-            style={'fontFamily': 'Roboto, sans-serif'}),
-
-        # Collapsible Form (add your create_post_form() here)
-        dbc.Collapse([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4("Create New Post", className="mb-3",
-                            style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
-
-                    dbc.Input(id="post-title-input", placeholder="Post Title", className="mb-3"),
-                    dbc.Textarea(id="post-content-input", placeholder="Post Content", rows=6, className="mb-3"),
-
-                    dcc.Dropdown(
-                        id="post-tier-dropdown",
-                        options=[
-                            {'label': 'Tier 1 - Public', 'value': 1},
-                            {'label': 'Tier 2 - Limited', 'value': 2},
-                            {'label': 'Tier 3 - Complete', 'value': 3},
-                            {'label': 'Tier 4 - Admin', 'value': 4}
-                        ],
-                        value=1,
-                        placeholder="Select Access Level",
-                        className="mb-3"
-                    ),
-
-                    dcc.Dropdown(
-                        id="post-category-dropdown",
-                        options=[
-                            {'label': 'Announcement', 'value': 'announcement'},
-                            {'label': 'News', 'value': 'news'},
-                            {'label': 'Event', 'value': 'event'}
-                        ],
-                        value='announcement',
-                        placeholder="Select Category",
-                        className="mb-3"
-                    ),
-
-                    dcc.Dropdown(
-                        id="post-duration-dropdown",
-                        options=[
-                            {'label': 'Permanent', 'value': 'permanent'},
-                            {'label': '7 Days', 'value': '7'},
-                            {'label': '30 Days', 'value': '30'}
-                        ],
-                        value='permanent',
-                        placeholder="Select Duration",
-                        className="mb-3"
-                    ),
-
-                    dbc.Checklist(
-                        id="post-options-checklist",
-                        options=[
-                            {'label': 'Pin to Top', 'value': 'pinned'},
-                            {'label': 'Enable Comments', 'value': 'comments'}
-                        ],
-                        value=[],
-                        className="mb-3"
-                    ),
-
-                    html.Div(id="post-expiration-date", style={'display': 'none'}),
-                    html.Div(id="custom-date-container", style={'display': 'none'}),
+            style=_STYLE_ROBOTO),
 
-                    dbc.ButtonGroup([
-                        dbc.Button("Publish Post", id="submit-post-btn", color="success"),
-                        dbc.Button("Cancel", id="cancel-post-btn", color="secondary", outline=True)
-                    ])
-                ])
-            ])
-        ], id="post-form-collapse", is_open=False, className="mb-4"),
+        # Collapsible Form
+        _CREATE_POST_FORM,
 
         # ✅ SIMPLE POSTS LIST WITH DELETE BUTTONS
         html.H4("All Posts", className="mt-4 mb-3",
-                style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
+                style=_STYLE_TITLE_GREEN),
 
         html.Div([
             create_simple_posts_list_with_delete(posts)
@@ -373,75 +521,90 @@ def create_simple_posts_list_with_delete(posts):
 
     if not posts:
         return dbc.Alert("No posts yet. Create your first post!", color="info",
-                         style={'fontFamily': 'Roboto, sans-serif'})
+                         style=_STYLE_ROBOTO)
 
-    post_items = []
-    for post in posts:
+    # Only the first page is rendered; load_more_admin_posts appends the rest
+    first_page = posts[:ADMIN_POSTS_PAGE_SIZE]
+    return html.Div([
+        html.Div([create_post_list_item(post) for post in first_page],
+                 id='admin-posts-list'),
+        dcc.Store(id='admin-posts-shown-ids', data=[post['id'] for post in first_page]),
+        _ADMIN_LOAD_MORE_BUTTON if len(posts) > ADMIN_POSTS_PAGE_SIZE else _EMPTY_DIV
+    ])
 
-        # Format date
-        from datetime import datetime
-        try:
-            created_date = datetime.fromisoformat(post['created_at']).strftime("%b %d, %Y")
-        except:
-            created_date = "Unknown"
 
-        post_item = dbc.Card([
-            dbc.CardBody([
-                dbc.Row([
-                    # Post info column
-                    dbc.Col([
-                        html.H5(post.get('title', 'Untitled'), className="mb-2",
-                                style={'color': USC_COLORS['primary_green'], 'fontFamily': 'Roboto, sans-serif'}),
-                        html.P(
-                            (post.get('content', '')[:120] + "..."
-                             if len(post.get('content', '')) > 120
-                             else post.get('content', '')),
-                            className="text-muted mb-2",
-                            style={'fontFamily': 'Roboto, sans-serif'}
-                        ),
-                        html.Div([
-                            dbc.Badge(f"Tier {post.get('min_access_tier', 1)}",
-                                      color="info", className="me-2"),
-                            dbc.Badge(post.get('category', 'announcement').title(),
-                                      color="secondary", className="me-2"),
-                            dbc.Badge("Pinned", color="warning", className="me-2") if post.get(
-                                'is_pinned') else html.Span(),
-                            html.Small(f"Created: {created_date}", className="text-muted")
-                        ])
-                    ], width=8),
-
-                    # Action buttons column
-                    dbc.Col([
-                        html.Div([
-                            # ✅ SIMPLE DELETE BUTTON
-                            dbc.Button([
-                                html.I(className="fas fa-trash me-2"),
-                                "Delete"
-                            ],
-                                id={'type': 'simple-delete-post', 'post_id': post['id']},
-                                color="danger",
-                                size="sm",
-                                outline=True,
-                                className="mb-2 w-100",
-                                style={'fontFamily': 'Roboto, sans-serif'}),
-
-                            # Edit button (optional)
-                            dbc.Button([
-                                html.I(className="fas fa-edit me-2"),
-                                "Edit"
-                            ],
-                                color="primary",
-                                size="sm",
-                                outline=True,
-                                className="w-100",
-                                style={'fontFamily': 'Roboto, sans-serif'},
-                                disabled=True)  # Disable for now
-                        ])
-                    ], width=4)
-                ])
-            ])
-        ], className="mb-3 shadow-sm")
+def _tier_label(tier: int) -> str:
+    """Badge label for an access tier"""
+    label = _TIER_LABELS.get(tier)
+    if label is None:
+        label = f"Tier {tier}"
+    return label
+
+
+# Management list rows rendered per page
+ADMIN_POSTS_PAGE_SIZE = 25
+_ADMIN_LOAD_MORE_BUTTON = dbc.Button("Load more posts", id="admin-posts-load-more-btn", color="primary",
+                                     outline=True, className="w-100", style=_STYLE_ROBOTO)
+
+# Edit button is identical for every row while editing is disabled
+_EDIT_BUTTON = dbc.Button([_ICON_EDIT, "Edit"], color="primary", size="sm", outline=True,
+                          className="w-100", style=_STYLE_ROBOTO,
+                          disabled=True)  # Disable for now
+
+
+def create_post_list_item(post: Dict) -> dbc.Card:
+    """Single row of the management posts list"""
 
-        post_items.append(post_item)
+    # Format date
+    try:
+        created_date = _format_iso(post['created_at'], "%b %d, %Y")
+    except (ValueError, KeyError, TypeError):
+        created_date = "Unknown"
 
-    return html.Div(post_items)
\ No newline at end of file
+    meta_items = [
+        dbc.Badge(_tier_label(post['min_access_tier']),
+                  color="info", className="me-2"),
+        dbc.Badge(_category_label(post['category']),
+                  color="secondary", className="me-2")
+    ]
+    if post['is_pinned']:
+        meta_items.append(_PINNED_BADGE_INLINE)
+    meta_items.append(html.Small(f"Created: {created_date}", className="text-muted"))
+
+    return dbc.Card([
+        dbc.CardBody([
+            dbc.Row([
+                # Post info column
+                dbc.Col([
+                    html.H5(post['title'], className="mb-2",
+                            style=_STYLE_TITLE_GREEN),
+                    html.P(
+                        _post_excerpt(post),
+                        className="text-muted mb-2",
+                        style=_STYLE_ROBOTO
+                    ),
+                    html.Div(meta_items)
+                ], width=8),
+
+                # Action buttons column
+                dbc.Col([
+                    html.Div([
+                        # ✅ SIMPLE DELETE BUTTON
+                        dbc.Button([
+                            _ICON_TRASH,
+                            "Delete"
+                        ],
+                            id={'type': 'simple-delete-post', 'post_id': post['id']},
+                            color="danger",
+                            size="sm",
+                            outline=True,
+                            className="mb-2 w-100",
+                            style=_STYLE_ROBOTO),
+
+                        # Edit button (optional)
+                        _EDIT_BUTTON
+                    ])
+                ], width=4)
+            ])
+        ])
+    ], className="mb-3 shadow-sm")
@@ -6,7 +6,11 @@ No need for individual loaders per section
 
 import pandas as pd
 import os
+import re
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import json
@@ -15,6 +19,42 @@ import json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prefer the Rust-backed calamine engine (much faster xlsx parsing); fall back to
+# openpyxl, which pandas already opens read-only/data-only without external links
+try:
+    import python_calamine
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    python_calamine = None
+    EXCEL_ENGINE = "openpyxl"
+
+# Academic/fiscal year labels such as 2019-20, 2019/2020, 2019_20 or 2022 - 2023
+YEAR_RE = re.compile(r'20\d{2}\s*[-/_]\s*\d')
+
+# Maximum number of workbooks kept in the loader's in-memory cache
+FILE_CACHE_SIZE = 32
+
+# Currency symbols, thousands separators, whitespace and percent signs
+NUMBER_JUNK_RE = re.compile(r'[\$,\s%]')
+
+# Columns shorter than this are cleaned with a list comprehension, which has
+# less per-call overhead than the pandas .str accessor
+SMALL_COLUMN_ROWS = 1000
+
+# Cell values treated as zero when cleaning numeric columns
+BLANK_MARKERS = frozenset({'-', '', 'nan', 'None', 'null'})
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    """Stat a file once, returning None if it does not exist or cannot be read"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def _sample_nonnull(s: pd.Series, n: int) -> pd.Series:
+    """First n non-null values, scanning only the head of the column rather than all of it"""
+    return s.iloc[:max(1000, n * 20)].dropna().iloc[:n]
+
 class UniversalFactbookLoader:
     """
     Single data loader that handles ALL factbook Excel files
@@ -29,7 +69,11 @@ class UniversalFactbookLoader:
             data_directory: Directory containing all Excel files
         """
         self.data_directory = data_directory
-        self.file_cache = {}
+        # file path -> {'data', 'last_modified', 'keep_raw'}, least recently used first
+        self.file_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # file path -> (mtime, sheet names) for get_section_summary
+        self._sheet_names_cache: Dict[str, Tuple[float, List[str]]] = {}
         self.last_scan = None
         
         # Factbook file mapping (from your factbook landing page)
@@ -66,50 +110,78 @@ class UniversalFactbookLoader:
             raise ValueError(f"Unknown section: {section_key}")
         return os.path.join(self.data_directory, filename)
     
-    def _file_was_modified(self, file_path: str) -> bool:
-        """Check if file has been modified since last cache"""
-        try:
-            current_modified = os.path.getmtime(file_path)
-            cached_time = self.file_cache.get(file_path, {}).get('last_modified', 0)
-            return current_modified > cached_time
-        except OSError:
-            return True
+    def _get_cached(self, file_path: str, mtime: float, keep_raw: bool) -> Optional[Dict[str, Any]]:
+        """Return the cached response for file_path if it was loaded from this mtime"""
+        with self._cache_lock:
+            cached = self.file_cache.get(file_path)
+            if (cached and cached['last_modified'] == mtime
+                    and (cached['keep_raw'] or not keep_raw)):
+                self.file_cache.move_to_end(file_path)
+                return cached['data']
+        return None
+    
+    def _store_cached(self, file_path: str, mtime: float, keep_raw: bool,
+                      response: Dict[str, Any]):
+        """Cache a response, evicting the least recently used workbook when full"""
+        with self._cache_lock:
+            self.file_cache[file_path] = {
+                'data': response,
+                'last_modified': mtime,
+                'keep_raw': keep_raw
+            }
+            self.file_cache.move_to_end(file_path)
+            while len(self.file_cache) > FILE_CACHE_SIZE:
+                self.file_cache.popitem(last=False)
     
     def _clean_numeric_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean numeric columns in any DataFrame"""
-        df_clean = df.copy()
+        """Clean numeric columns in any DataFrame (the input frame is not modified)"""
+        # Shallow copy: cleaned columns are reassigned whole, so the source buffers are never written
+        df_clean = df.copy(deep=False)
         
-        for col in df_clean.columns:
-            if df_clean[col].dtype == 'object':
-                # Try to convert to numeric if it looks like numbers
-                sample_values = df_clean[col].dropna().astype(str).head(10)
-                if any(any(char.isdigit() for char in str(val)) for val in sample_values):
-                    # Clean currency symbols, commas, spaces
-                    df_clean[col] = df_clean[col].astype(str).str.replace(r'[\$,\s%]', '', regex=True)
-                    df_clean[col] = df_clean[col].replace(['-', '', 'nan', 'None', 'null'], '0')
-                    df_clean[col] = pd.to_numeric(df_clean[col], errors='ignore')
+        for col in df_clean.select_dtypes(include='object').columns:
+            series = df_clean[col]
+            # Try to convert to numeric if it looks like numbers (plain Python beats
+            # the .str accessor on a 10-value sample)
+            sample_values = _sample_nonnull(series, 10).astype(str).tolist()
+            if any(char.isdigit() for val in sample_values for char in val):
+                # Clean currency symbols, commas, spaces
+                if len(series) < SMALL_COLUMN_ROWS:
+                    cleaned = pd.Series(
+                        [NUMBER_JUNK_RE.sub('', str(val)) for val in series.tolist()],
+                        index=series.index, dtype=object
+                    )
+                else:
+                    cleaned = series.astype(str).str.replace(NUMBER_JUNK_RE, '', regex=True)
+                
+                # Blank markers become 0
+                cleaned = cleaned.where(~cleaned.isin(BLANK_MARKERS), '0')
+                converted = pd.to_numeric(cleaned, errors='coerce')
+                
+                # Convert only when every cell parses; otherwise keep the cleaned text so
+                # labels and IDs such as 'OS0001' are never turned into NaN
+                df_clean[col] = converted if converted.notna().all() else cleaned
         
         return df_clean
     
-    def _detect_year_patterns(self, df: pd.DataFrame) -> List[str]:
-        """Detect year columns or values in any DataFrame"""
-        year_patterns = []
-        
+    def _detect_year_patterns(self, df: pd.DataFrame, max_patterns: int = 10) -> List[str]:
+        """Detect year columns or values in any DataFrame (cell scan stops at max_patterns)"""
         # Check column names
-        for col in df.columns:
-            col_str = str(col)
-            if '20' in col_str and any(sep in col_str for sep in ['-', '/', '_']):
-                year_patterns.append(col_str)
+        seen_cols = {col for col in df.columns if YEAR_RE.search(str(col))}
+        year_patterns = {str(col).strip() for col in seen_cols}
         
-        # Check cell values for year patterns
-        for col in df.columns:
-            sample_values = df[col].dropna().astype(str).head(20)
-            for val in sample_values:
-                if '20' in val and any(sep in val for sep in ['-', '/', '_']) and len(val) > 7:
-                    year_patterns.append(val)
-                    break
+        # Check cell values for year patterns (first match per text column)
+        for col in df.select_dtypes(include='object').columns:
+            if len(year_patterns) >= max_patterns:
+                break
+            if col in seen_cols:
+                continue
+            sample_values = _sample_nonnull(df[col], 20).astype(str)
+            matches = sample_values[sample_values.str.contains(YEAR_RE)
+                                    & (sample_values.str.len() > 7)]
+            if not matches.empty:
+                year_patterns.add(matches.iloc[0].strip())
         
-        return sorted(list(set(year_patterns)))
+        return sorted(year_patterns)
     
     def _analyze_data_structure(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze any DataFrame and return its structure"""
@@ -123,39 +195,53 @@ class UniversalFactbookLoader:
             'has_percentages': False
         }
         
-        for col in df.columns:
-            if df[col].dtype in ['int64', 'float64']:
-                analysis['numeric_columns'].append(col)
-            elif pd.api.types.is_numeric_dtype(df[col]):
+        has_totals = has_percentages = False
+        
+        # Single walk over the columns: classify each one and check its name and,
+        # for text columns, its cells for common patterns
+        for i, (col, dtype) in enumerate(df.dtypes.items()):
+            col_name = str(col).lower()
+            has_totals = has_totals or 'total' in col_name
+            has_percentages = has_percentages or '%' in col_name
+            
+            if pd.api.types.is_numeric_dtype(dtype):
                 analysis['numeric_columns'].append(col)
-            else:
-                analysis['text_columns'].append(col)
+                continue
+            
+            analysis['text_columns'].append(col)
+            if dtype == object and not (has_totals and has_percentages):
+                values = df.iloc[:, i].astype(str)
+                if not has_totals:
+                    has_totals = bool(values.str.contains('total', case=False, regex=False).any())
+                if not has_percentages:
+                    has_percentages = bool(values.str.contains('%', regex=False).any())
         
-        # Check for common patterns
-        df_str = df.astype(str).apply(lambda x: ' '.join(x)).str.lower()
-        if any('total' in text for text in df_str):
-            analysis['has_totals'] = True
-        if any('%' in text for text in df_str):
-            analysis['has_percentages'] = True
+        analysis['has_totals'] = has_totals
+        analysis['has_percentages'] = has_percentages
             
         return analysis
     
-    def load_section_data(self, section_key: str, force_reload: bool = False) -> Dict[str, Any]:
+    def load_section_data(self, section_key: str, force_reload: bool = False,
+                          keep_raw: bool = False) -> Dict[str, Any]:
         """
         Load data for any factbook section
         
         Args:
             section_key: Section identifier (e.g., 'enrollment', 'financial-data')
             force_reload: Force reload even if cached
+            keep_raw: Also keep each sheet's uncleaned DataFrame under 'raw_data'
             
         Returns:
             Dictionary with all data and metadata for the section
         """
         file_path = self.get_file_path(section_key)
         
-        # Check cache
-        if not force_reload and not self._file_was_modified(file_path):
-            cached_data = self.file_cache.get(file_path, {}).get('data')
+        st = _stat(file_path)
+        mtime = st.st_mtime if st else None
+        
+        # Check cache (entries are keyed on mtime, so an edited file is never served stale)
+        if not force_reload and mtime is not None:
+            cached_data = self._get_cached(file_path, mtime, keep_raw)
             if cached_data:
                 logger.info(f"Using cached data for {section_key}")
                 return cached_data
@@ -163,17 +249,16 @@ class UniversalFactbookLoader:
         logger.info(f"Loading fresh data for {section_key} from {file_path}")
         
         try:
-            if not os.path.exists(file_path):
+            if st is None:
                 logger.error(f"File not found: {file_path}")
                 return self._get_empty_response(section_key, f"File not found: {file_path}")
             
-            # Read Excel file with all sheets
-            excel_file = pd.ExcelFile(file_path)
+            # Read all sheets in a single pass over the workbook
+            all_sheets = pd.read_excel(file_path, sheet_name=None, engine=EXCEL_ENGINE)
             sheets_data = {}
             
-            for sheet_name in excel_file.sheet_names:
+            for sheet_name, df in all_sheets.items():
                 try:
-                    df = pd.read_excel(excel_file, sheet_name=sheet_name)
                     if not df.empty:
                         # Clean the data
                         df_clean = self._clean_numeric_data(df)
@@ -183,9 +268,10 @@ class UniversalFactbookLoader:
                         
                         sheets_data[sheet_name] = {
                             'data': df_clean,
-                            'analysis': analysis,
-                            'raw_data': df  # Keep original for reference
+                            'analysis': analysis
                         }
+                        if keep_raw:
+                            sheets_data[sheet_name]['raw_data'] = df  # Keep original for reference
                         
                         logger.info(f"Loaded sheet '{sheet_name}' with shape {df.shape}")
                         
@@ -206,11 +292,8 @@ class UniversalFactbookLoader:
                 'success': True
             }
             
-            # Cache the result
-            self.file_cache[file_path] = {
-                'data': response,
-                'last_modified': os.path.getmtime(file_path)
-            }
+            # Cache the result against the mtime seen before reading
+            self._store_cached(file_path, mtime, keep_raw, response)
             
             logger.info(f"Successfully loaded {section_key}")
             return response
@@ -266,44 +349,78 @@ class UniversalFactbookLoader:
         file_path = self.get_file_path(section_key)
         
         try:
-            if not os.path.exists(file_path):
+            st = _stat(file_path)
+            if st is None:
                 return {'exists': False, 'error': 'File not found'}
             
-            # Quick scan without loading all data
-            excel_file = pd.ExcelFile(file_path)
-            
             return {
                 'exists': True,
                 'file_path': file_path,
-                'sheet_names': excel_file.sheet_names,
-                'file_size': os.path.getsize(file_path),
-                'last_modified': datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat()
+                'sheet_names': self._get_sheet_names(file_path, st.st_mtime),
+                'file_size': st.st_size,
+                'last_modified': datetime.fromtimestamp(st.st_mtime).isoformat()
             }
         except Exception as e:
             return {'exists': False, 'error': str(e)}
     
+    def _get_sheet_names(self, file_path: str, mtime: float) -> List[str]:
+        """List a workbook's sheets without parsing them, cached until the file changes"""
+        cached = self._sheet_names_cache.get(file_path)
+        if cached and cached[0] == mtime:
+            return list(cached[1])
+        
+        if python_calamine is not None:
+            sheet_names = python_calamine.CalamineWorkbook.from_path(file_path).sheet_names
+        else:
+            with pd.ExcelFile(file_path, engine=EXCEL_ENGINE) as excel_file:
+                sheet_names = excel_file.sheet_names
+        
+        self._sheet_names_cache[file_path] = (mtime, tuple(sheet_names))
+        return list(sheet_names)
+    
     def reload_all_sections(self) -> Dict[str, bool]:
         """Force reload all sections - useful for admin refresh"""
         results = {}
         
-        for section_key in self.factbook_files.keys():
-            try:
-                self.load_section_data(section_key, force_reload=True)
-                results[section_key] = True
-            except Exception as e:
-                logger.error(f"Failed to reload {section_key}: {e}")
-                results[section_key] = False
+        # Workbook reads are I/O and native parsing, so threads overlap them well
+        with ThreadPoolExecutor(max_workers=min(8, len(self.factbook_files))) as executor:
+            futures = {
+                executor.submit(self.load_section_data, section_key, force_reload=True): section_key
+                for section_key in self.factbook_files
+            }
+            for future in as_completed(futures):
+                section_key = futures[future]
+                # load_section_data reports its own failures as success=False; exceptions
+                # only escape for errors outside its try block (e.g. an unknown section)
+                error = future.exception()
+                if error is not None:
+                    logger.error(f"Failed to reload {section_key}: {error}")
+                    results[section_key] = False
+                else:
+                    results[section_key] = bool(future.result().get('success', False))
         
-        return results
+        # Keep the section order of factbook_files
+        return {section_key: results[section_key] for section_key in self.factbook_files}
     
     def clear_cache(self):
         """Clear all cached data"""
-        self.file_cache.clear()
+        with self._cache_lock:
+            self.file_cache.clear()
         logger.info("Data cache cleared")
 
 
-# Global instance - single loader for entire application
-universal_loader = UniversalFactbookLoader()
+# Global instance - single loader for entire application, created on first use
+_universal_loader: Optional[UniversalFactbookLoader] = None
+_universal_loader_lock = threading.Lock()
+
+def _get_loader() -> UniversalFactbookLoader:
+    """Return the shared loader, creating it the first time it is needed"""
+    global _universal_loader
+    if _universal_loader is None:
+        with _universal_loader_lock:
+            if _universal_loader is None:
+                _universal_loader = UniversalFactbookLoader()
+    return _universal_loader
 
 # Convenience functions for easy use throughout the application
 def load_factbook_section(section_key: str, force_reload: bool = False) -> Dict[str, Any]:
@@ -315,7 +432,7 @@ def load_factbook_section(section_key: str, force_reload: bool = False) -> Dict[
         load_factbook_section('financial-data')
         load_factbook_section('student-labour')
     """
-    return universal_loader.load_section_data(section_key, force_reload)
+    return _get_loader().load_section_data(section_key, force_reload)
 
 def get_section_years(section_key: str) -> List[str]:
     """Get available years for any section"""
@@ -324,16 +441,16 @@ def get_section_years(section_key: str) -> List[str]:
 
 def get_all_sections() -> List[str]:
     """Get list of all available factbook sections"""
-    return universal_loader.get_available_sections()
+    return _get_loader().get_available_sections()
 
 def refresh_section(section_key: str) -> bool:
     """Force refresh a specific section"""
     try:
-        universal_loader.load_section_data(section_key, force_reload=True)
+        _get_loader().load_section_data(section_key, force_reload=True)
         return True
     except Exception:
         return False
 
 def get_section_info(section_key: str) -> Dict[str, Any]:
     """Get basic info about a section without loading full data"""
-    return universal_loader.get_section_summary(section_key)
\ No newline at end of file
+    return _get_loader().get_section_summary(section_key)
\ No newline at end of file
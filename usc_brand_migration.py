@@ -59,6 +59,21 @@ class USCBrandMigrator:
             'font-size: 2rem': 'font-size: 43.95px',
         }
         
+        # Every substitution in one pattern, longest first so that e.g.
+        # 'fontFamily: "Inter"' wins over the bare 'Inter'
+        self._all_subs = {**self.color_mapping, **self.font_mapping, **self.typography_updates}
+        self._sub_labels = {
+            **dict.fromkeys(self.color_mapping, ''),
+            **dict.fromkeys(self.font_mapping, 'font '),
+            **dict.fromkeys(self.typography_updates, 'size '),
+        }
+        self._sub_re = re.compile(
+            '|'.join(re.escape(old) for old in sorted(self._all_subs, key=len, reverse=True))
+        )
+        
+        # USC_COLORS dictionary literal ([^}] already spans newlines)
+        self._usc_colors_re = re.compile(r"USC_COLORS\s*=\s*\{[^}]+\}")
+        
         self.files_processed = []
         self.changes_made = []
     
@@ -86,82 +101,53 @@ class USCBrandMigrator:
     
     def find_python_files(self) -> List[Path]:
         """Find all Python files in the project"""
-        python_files = []
-        
-        for pattern in ["*.py", "**/*.py"]:
-            python_files.extend(self.project_root.glob(pattern))
+        # rglob already includes top-level files, so each file is found once
+        python_files = set(self.project_root.rglob("*.py"))
         
         # Filter out backup directory and common excludes
-        excluded_patterns = [
+        excluded = (
             'brand_migration_backup',
             '__pycache__',
-            '.git',
+            'site-packages',
+            'node_modules',
             'venv',
-            'env',
-            'node_modules'
-        ]
+            'env'
+        )
         
-        filtered_files = []
-        for file_path in python_files:
-            if not any(excluded in str(file_path) for excluded in excluded_patterns):
-                filtered_files.append(file_path)
+        def is_excluded(directory: str) -> bool:
+            # Hidden directories (.git, .venv, .tox, ...) and any directory whose name
+            # contains an excluded name (venv, myenv, env_prod, ...)
+            return directory.startswith('.') or any(name in directory for name in excluded)
         
-        return filtered_files
+        return sorted(
+            file_path for file_path in python_files
+            if not any(is_excluded(directory)
+                       for directory in file_path.relative_to(self.project_root).parts[:-1])
+        )
     
-    def update_colors_in_file(self, file_path: Path) -> int:
-        """Update color values in a single file"""
-        changes_count = 0
+    def update_colors_in_content(self, content: str) -> Tuple[str, int]:
+        """Update color values, fonts and sizes in file content"""
+        # Update colors, font families and typography sizes in a single pass
+        matched = {}
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            original_content = content
-            
-            # Update color hex codes
-            for old_color, new_color in self.color_mapping.items():
-                if old_color in content:
-                    content = content.replace(old_color, new_color)
-                    changes_count += 1
-                    print(f"    Updated {old_color} -> {new_color}")
-            
-            # Update font families
-            for old_font, new_font in self.font_mapping.items():
-                if old_font in content:
-                    content = content.replace(old_font, new_font)
-                    changes_count += 1
-                    print(f"    Updated font {old_font} -> {new_font}")
-            
-            # Update typography sizes
-            for old_size, new_size in self.typography_updates.items():
-                if old_size in content:
-                    content = content.replace(old_size, new_size)
-                    changes_count += 1
-                    print(f"    Updated size {old_size} -> {new_size}")
-            
-            # Write back if changes were made
-            if content != original_content:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                print(f"    ✅ Updated {file_path}")
-            
-        except Exception as e:
-            print(f"    ❌ Error updating {file_path}: {e}")
+        def substitute(match):
+            old = match.group(0)
+            matched[old] = None
+            return self._all_subs[old]
         
-        return changes_count
+        content = self._sub_re.sub(substitute, content)
+        
+        for old in matched:
+            print(f"    Updated {self._sub_labels[old]}{old} -> {self._all_subs[old]}")
+        
+        return content, len(matched)
     
-    def update_usc_colors_dict(self, file_path: Path) -> bool:
+    def update_usc_colors_dict(self, content: str) -> Tuple[str, bool]:
         """Update USC_COLORS dictionary specifically"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Look for USC_COLORS dictionary pattern
-            usc_colors_pattern = r"USC_COLORS\s*=\s*\{[^}]+\}"
-            
-            if re.search(usc_colors_pattern, content, re.DOTALL):
-                # Replace the entire USC_COLORS dictionary
-                new_usc_colors = """USC_COLORS = {
+        if 'USC_COLORS' not in content:
+            return content, False
+        
+        new_usc_colors = """USC_COLORS = {
     # Primary USC Colors (Updated to Official Guidelines)
     'primary_green': '#10633C',      # USC Green Dark
     'mid_green': '#139B49',          # USC Mid Green  
@@ -185,19 +171,38 @@ class USCBrandMigrator:
     'text_dark': '#2E2E2E',          # Bootstrap compatible
     'text_gray': '#2E2E2E'           # Legacy compatibility
 }"""
-                
-                content = re.sub(usc_colors_pattern, new_usc_colors, content, flags=re.DOTALL)
-                
+        
+        # Replace the entire USC_COLORS dictionary; a function replacement keeps
+        # backslashes in the new text from being read as group references
+        content, count = self._usc_colors_re.subn(lambda match: new_usc_colors, content)
+        return content, count > 0
+    
+    def process_file(self, file_path: Path) -> int:
+        """Migrate a single file with one read and at most one write"""
+        changes_count = 0
+        
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                original_content = f.read()
+            
+            content, changes_count = self.update_colors_in_content(original_content)
+            
+            # Update USC_COLORS dictionary if present
+            content, usc_colors_updated = self.update_usc_colors_dict(content)
+            if usc_colors_updated:
+                changes_count += 1
+                print(f"    ✅ Updated USC_COLORS dictionary in {file_path}")
+            
+            # Write back if changes were made
+            if content != original_content:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(content)
-                
-                print(f"    ✅ Updated USC_COLORS dictionary in {file_path}")
-                return True
-                
+                print(f"    ✅ Updated {file_path}")
+            
         except Exception as e:
-            print(f"    ❌ Error updating USC_COLORS in {file_path}: {e}")
+            print(f"    ❌ Error updating {file_path}: {e}")
         
-        return False
+        return changes_count
     
     def generate_migration_report(self):
         """Generate a detailed migration report"""
@@ -300,19 +305,7 @@ Generated on migration completion
                 print("    [DRY RUN - No changes made]")
                 continue
             
-            changes_in_file = 0
-            
-            # Update colors
-            changes_in_file += self.update_colors_in_file(file_path)
-            
-            # Update USC_COLORS dictionary if present
-            try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-                if 'USC_COLORS' in content:
-                    if self.update_usc_colors_dict(file_path):
-                        changes_in_file += 1
-            except:
-                pass
+            changes_in_file = self.process_file(file_path)
             
             if changes_in_file > 0:
                 self.files_processed.append(str(file_path))